@@ -132,7 +132,9 @@ def create_connection(args):
     conn = None
     cursor = None
     try:
-        conn = sqlite3.connect(dcpd_db)  # Connect to the SQLite database
+        # Connect to the SQLite database. The statement cache is sized explicitly so the fixed queries
+        # issued on every run (e.g. in dcpd_stats) are prepared once and then reused.
+        conn = sqlite3.connect(dcpd_db, cached_statements=128)
         conn.row_factory = sqlite3.Row  # Set the row factory for result rows
         cursor = conn.cursor()  # Initialize a cursor to execute SQL commands
         logger_info.info("Successfully created a new database connection and initialized a cursor for dcpd_db.")
@@ -185,6 +185,7 @@ def dcpd(args):
         logger_info.info("Services attached to host networking collected.")
 
         # Generate the statistics and write to a file
+        dcpd_stats.configure_connection_for_stats(cursor.connection)
         dcpd_stats.execute_statistics_generation(cursor, args)
 
         # Process arguments that require extracting and presenting data from the database in various ways.
@@ -266,6 +267,9 @@ def execute_dcpd():
     # Parsing command-line arguments to determine the user's desired functionality.
     args = dcpd_ap.parse_arguments()
 
+    # Route verbose statistics output through the statistics logger instead of separate print() calls.
+    dcpd_stats.configure_verbose_logging(args)
+
     # Entry messages
     logger_info.info("Starting the Docker Compose Ports Dump (DCPD) execution.")
     if args.verbose:
@@ -6,11 +6,19 @@ The statistics include information about Docker Compose files, unique services,
 and system performance metrics.
 
 Module Contents:
+- configure_verbose_logging: Echo this module's log messages to the console in verbose mode.
+- configure_connection_for_stats: Tune the SQLite connection for the statistics queries.
 - compute_lines_in_docker_compose: Compute the total number of lines across all docker-compose.yml files.
 - fetch_unique_service_count: Fetch the count of unique services from the database.
 - fetch_all_services: Fetch all service details from the database.
+- fetch_services_with_unique_count: Fetch all services and the unique service count in one table scan.
 - fetch_all_port_mappings: Fetch all port mapping details from the database.
+- fetch_port_mappings_columns: Fetch all port mapping details as typed columns.
 - fetch_all_host_networking: Fetch all host networking details from the database.
+- fetch_service_count: Fetch the number of service records without fetching the rows.
+- fetch_port_mapping_count: Fetch the number of port mapping records without fetching the rows.
+- fetch_host_networking_count: Fetch the number of host networking records without fetching the rows.
+- fetch_statistics_counts: Fetch the unique service, port mapping, and host networking counts in one query.
 - write_statistics_to_file: Write generated statistics to an output file.
 - execute_statistics_generation: Fetch data, generate statistics, and write them to an output file.
 - get_system_info: Fetch the current CPU and memory utilization of the system.
@@ -22,91 +30,303 @@ The resulting statistics can be written to an output file for further analysis a
 """
 
 # Import required modules
-import datetime
+import logging
 import os
 import sqlite3
+import stat
 import sys
-from typing import Dict, Tuple, List, Any
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple, Iterator, List, Any
 import psutil
 
 # Add config to the sys path
-# pylint: disable=wrong-import-position
+# pylint: disable=wrong-import-position,unused-argument
 sys.path.extend(['.', '../config'])
 
 # Third-party imports (if any)
 import dcpd_config
 
-# Custom module imports
-import dcpd_log_debug
-import dcpd_log_info
+# Look the loggers up by name rather than importing dcpd_log_info and dcpd_log_debug, so importing this
+# module does not build handlers or open log files. The application configures both loggers when it
+# imports those modules at startup. The statistics logger is a child of the shared info logger, so its
+# records still reach the info log file while verbose console output can be attached to it alone.
+logger_info = logging.getLogger("dcpd_logger_info.stats")
+logger_debug = logging.getLogger("dcpd_logger_debug")
 
-# Create an alias for convenience
-logger_info = dcpd_log_info.logger
-logger_debug = dcpd_log_debug.logger
+# -------------------------------------------------------------------------
+class _BufferedConsoleHandler(logging.Handler):
+    """
+    Logging handler that collects formatted messages and writes them to stdout in one call.
+
+    Messages are held until flush(), which execute_statistics_generation() calls once the
+    statistics are written; logging.shutdown() flushes anything left at exit.
+    """
+
+    def __init__(self):
+        super().__init__(logging.INFO)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.messages:
+                sys.stdout.write("\n".join(self.messages) + "\n")
+                sys.stdout.flush()
+                self.messages.clear()
+        finally:
+            self.release()
+
+# Console handler used in verbose mode in place of separate print() calls. Errors are left to the
+# info logger's own console handler so they are not shown twice.
+_verbose_handler = _BufferedConsoleHandler()
+_verbose_handler.addFilter(lambda record: record.levelno < logging.ERROR)
 
 default_docker_compose_file = dcpd_config.DEFAULT_DOCKER_COMPOSE_FILE
+
+# The configuration allows either a single docker-compose file or a list of them. Normalising it once
+# here lets compute_lines_in_docker_compose handle both with one loop.
+_COMPOSE_FILES = (
+    tuple(default_docker_compose_file)
+    if isinstance(default_docker_compose_file, list)
+    else (default_docker_compose_file,)
+)
 OUTPUT_FILE = "../data/dcpd_stats.txt"
 
+# Directory containing OUTPUT_FILE, and a flag set once it has been created.
+_OUTPUT_DIR = os.path.dirname(OUTPUT_FILE)
+_output_dir_ready = False
+
+# Size of the binary chunks read when counting lines in docker-compose files.
+_READ_CHUNK_SIZE = 1 << 16
+
+# Upper bound on the threads used to count lines when several docker-compose files are configured.
+_MAX_COUNT_WORKERS = 8
+
+# Line counts of docker-compose files keyed by path, stored as (st_mtime_ns, st_size, line_count).
+_line_count_cache: Dict[str, Tuple[int, int, int]] = {}
+
+# SQL statements used by the statistics queries. Keeping them as module constants means every call
+# hands sqlite3 the exact same string, so the connection's statement cache skips re-preparing them.
+_Q_UNIQUE_SVC = "SELECT COUNT(DISTINCT service_name) FROM service_info"
+_Q_ALL_SERVICES = "SELECT * FROM service_info"
+_Q_ALL_PORT_MAPPINGS = "SELECT * FROM port_mappings"
+_Q_ALL_HOST_NETWORKING = "SELECT * FROM host_networking"
+_Q_PORT_MAPPING_COLUMNS = "SELECT id, external_port, mapping_values FROM port_mappings"
+_Q_COUNT_SERVICES = "SELECT COUNT(*) FROM service_info"
+_Q_COUNT_PORT_MAPPINGS = "SELECT COUNT(*) FROM port_mappings"
+_Q_COUNT_HOST_NETWORKING = "SELECT COUNT(*) FROM host_networking"
+
+# port_mappings and host_networking are counted with MAX(_ROWID_), a single lookup of the rightmost
+# b-tree entry, instead of a COUNT(*) scan. This is only exact while both tables are append-only:
+# dcpd_compose_parser.create_connection() deletes and recreates the database on every run, the
+# AUTOINCREMENT ids therefore start at 1, and nothing deletes rows from either table. If rows are
+# ever deleted from these tables, switch back to COUNT(*).
+_Q_STATS_COUNTS = (
+    "SELECT (SELECT COUNT(DISTINCT service_name) FROM service_info) AS unique_services,"
+    " (SELECT COALESCE(MAX(_ROWID_), 0) FROM port_mappings) AS port_mappings,"
+    " (SELECT COALESCE(MAX(_ROWID_), 0) FROM host_networking) AS host_networking"
+)
+
+# The same aggregates as a per-connection view. configure_connection_for_stats() creates it, so
+# statistics that are added later only need a new column here, not another query.
+_Q_CREATE_STATS_VIEW = "CREATE TEMP VIEW IF NOT EXISTS stats_summary AS " + _Q_STATS_COUNTS
+_Q_STATS_SUMMARY = "SELECT unique_services, port_mappings, host_networking FROM stats_summary"
+
+# Connection settings applied by configure_connection_for_stats(). journal_mode=WAL is left out on
+# purpose: it is persisted in the database file and leaves -wal/-shm files next to it in the data
+# directory, and there are no concurrent writers to benefit from it.
+_STATS_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# -------------------------------------------------------------------------
+def configure_verbose_logging(args) -> None:
+    """
+    Echo the statistics logger's messages to the console when verbose mode is enabled.
+
+    Called once at startup so the functions in this module only need to log, instead of
+    logging and printing separately.
+
+    Args:
+        args: Object that may contain a verbose flag for detailed logging.
+    """
+    if args.verbose and _verbose_handler not in logger_info.handlers:
+        logger_info.addHandler(_verbose_handler)
+
+# -------------------------------------------------------------------------
+def configure_connection_for_stats(conn: sqlite3.Connection) -> None:
+    """
+    Tune the SQLite connection for the read-only statistics queries.
+
+    Keeps temporary tables in memory, enlarges the page cache to 64 MiB, lets SQLite read the
+    database through mmap, and creates the temporary stats_summary view. These settings apply to
+    this connection only and are not stored in the database file.
+
+    Args:
+        conn (sqlite3.Connection): Connection whose cursor is passed to execute_statistics_generation.
+    """
+    try:
+        for pragma in _STATS_PRAGMAS:
+            conn.execute(pragma)
+        conn.execute(_Q_CREATE_STATS_VIEW)
+        logger_info.info("Configured database connection for statistics queries.")
+    except sqlite3.Error as error:
+        # The pragmas are only a performance aid, so a failure is logged and the defaults are kept.
+        logger_info.error("Failed to configure database connection for statistics: %s", error)
+        logger_debug.exception("SQLite error while configuring connection for statistics")
+
+# -------------------------------------------------------------------------
+def _count_file_lines(path: str, stat_result: os.stat_result) -> int:
+    """
+    Count the lines in a file, reusing the previous count while the file is unchanged.
+
+    The modification time and size of each file are remembered alongside its line count, so a
+    repeated statistics run only needs the caller's single os.stat() for compose files that have
+    not changed.
+
+    Args:
+        path (str): Path of the file to count.
+        stat_result (os.stat_result): Result of os.stat() on the file.
+
+    Returns:
+        int: Number of lines in the file.
+    """
+    cached = _line_count_cache.get(path)
+    if cached is not None and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+        return cached[2]
+
+    lines = _scan_file_lines(path, stat_result.st_size)
+    _line_count_cache[path] = (stat_result.st_mtime_ns, stat_result.st_size, lines)
+    return lines
+
+# -------------------------------------------------------------------------
+def _scan_file_lines(path: str, size: int) -> int:
+    """
+    Count the lines in a file without building a string object for every line.
+
+    The file is read in fixed-size binary chunks and the newlines in each chunk are counted.
+    A final line without a trailing newline is counted too, matching len(file.readlines()).
+
+    Args:
+        path (str): Path of the file to count.
+        size (int): Size of the file in bytes, as reported by os.stat(). Empty files are not opened.
+
+    Returns:
+        int: Number of lines in the file.
+    """
+    if not size:
+        return 0
+
+    # Line counting is deliberately left to CPython's built-in, C-level scanning rather than a Numba
+    # or C-extension kernel. Counting newlines is bound by memory bandwidth, bytes.count(b'\n') already
+    # runs as a memchr-style scan in C, and a JIT kernel would only add dispatch overhead plus a heavy
+    # dependency. Keep it that way unless a benchmark shows otherwise.
+    with open(path, 'rb') as compose_file:
+        lines = 0
+        last_chunk = b''
+        while chunk := compose_file.read(_READ_CHUNK_SIZE):
+            lines += chunk.count(b'\n')
+            last_chunk = chunk
+
+    if last_chunk and not last_chunk.endswith(b'\n'):
+        lines += 1
+
+    return lines
+
+# -------------------------------------------------------------------------
+def _count_compose_file_lines(file: str) -> int:
+    """
+    Count the lines in one docker-compose file, logging the result.
+
+    Missing or unreadable files are logged and count as 0 lines.
+
+    Args:
+        file (str): Path of the docker-compose file.
+
+    Returns:
+        int: Number of lines in the file.
+    """
+
+    # A single os.stat() both detects missing files and provides the line count cache key.
+    try:
+        stat_result = os.stat(file)
+    except OSError:
+        # Like os.path.isfile(), treat a path that cannot be stat'ed as missing.
+        stat_result = None
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+        logger_info.error("Missing compose file: %s", file)
+        return 0
+
+    try:
+        lines = _count_file_lines(file, stat_result)
+    except IOError as ioerror:
+        # If there's an issue reading the file, an error is logged.
+        logger_info.error("Error reading %s: %s", file, ioerror)
+        logger_debug.exception("IOError while reading %s", file)
+        return 0
+
+    logger_info.info("File %s has %s lines.", file, lines)
+    return lines
+
 # -------------------------------------------------------------------------
 def compute_lines_in_docker_compose(args) -> int:
     """
     Compute the total number of lines across all the docker-compose.yml files
     specified in the dcpd_config.
 
-    This function reads each file and calculates its number of lines. If the
-    docker-compose file is specified as a list, it reads through each file in the list.
+    This function reads each file and calculates its number of lines. The configured
+    file or list of files is normalised to _COMPOSE_FILES at import time.
 
     Returns:
         int: Total number of lines across all the docker-compose.yml files.
     """
 
-    # Logging the initiation of the function. If verbosity is enabled using `args`,
-    # the function prints an informative message about the start of the computation.
+    # Logging the initiation of the function.
     logger_info.info("Entered compute_lines_in_docker_compose()")
-    if args.verbose:
-        print("Starting computation of total lines in docker-compose.yml files...")
-
-    total_lines = 0
-
-    # The function first checks if `default_docker_compose_file` is a list or a single string.
-    # This allows the function to handle configurations that specify multiple docker-compose files.
-    if isinstance(default_docker_compose_file, list):
-        for file in default_docker_compose_file:
-            try:
-                # For each file in the list, the function reads the file and counts its lines.
-                with open(file, 'r', encoding='utf-8') as file:
-                    lines = len(file.readlines())
-                    total_lines += lines
-                    if args.verbose:
-                        print(f"File {file} has {lines} lines.")
-            except IOError as ioerror:
-                # If there's an issue reading the file, an error is logged.
-                logger_info.error("Error reading %s: %s", file, ioerror)
-                logger_info.error("Error reading %s: %s", default_docker_compose_file, ioerror)
-    else:
-        # If `default_docker_compose_file` is a string, it represents a single file.
-        # The function reads this file and counts its lines.
-        try:
-            with open(default_docker_compose_file, 'r', encoding='utf-8') as file:
-                lines = len(file.readlines())
-                total_lines += lines
-                if args.verbose:
-                    print(f"File {default_docker_compose_file} has {lines} lines.")
-        except IOError as ioerror:
-            # Log any errors that occur while reading the file.
-            logger_info.error("Error reading %s: %s", default_docker_compose_file, ioerror)
-            logger_debug.exception("IOError while reading %s", default_docker_compose_file)
 
+    # The files are independent and file I/O releases the GIL, so several files are counted
+    # concurrently. A single file is counted directly to avoid the thread pool setup.
+    if len(_COMPOSE_FILES) > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_COUNT_WORKERS, len(_COMPOSE_FILES))) as executor:
+            total_lines = sum(executor.map(_count_compose_file_lines, _COMPOSE_FILES))
+    else:
+        total_lines = sum(map(_count_compose_file_lines, _COMPOSE_FILES))
 
     # At the end, the function logs the total number of lines across all files.
-    # If verbosity is enabled, this total is also printed to the console.
     logger_info.info("Total lines across all docker-compose.yml files: %s", total_lines)
-    if args.verbose:
-        print(f"Computed total lines in docker-compose.yml files: {total_lines}")
 
     # The function concludes by returning the total line count.
     return total_lines
 
+# -------------------------------------------------------------------------
+def _fetch_plain_row(cursor: sqlite3.Cursor, query: str) -> Tuple[Any, ...]:
+    """
+    Run a query and return its first row as a plain tuple.
+
+    The main connection uses sqlite3.Row as its row factory. Scalar count queries do not need
+    column names, so the cursor's row factory is switched off for the duration of the query.
+
+    Args:
+        cursor (sqlite3.Cursor): Database cursor to execute SQL commands.
+        query (str): SQL query to execute.
+
+    Returns:
+        Tuple[Any, ...]: The first row returned by the query.
+    """
+    saved_row_factory = cursor.row_factory
+    cursor.row_factory = None
+    try:
+        return cursor.execute(query).fetchone()
+    finally:
+        cursor.row_factory = saved_row_factory
+
 # -------------------------------------------------------------------------
 def fetch_unique_service_count(cursor: sqlite3.Cursor, args) -> int:
     """
@@ -119,24 +339,17 @@ def fetch_unique_service_count(cursor: sqlite3.Cursor, args) -> int:
         int: Count of unique services.
     """
 
-    # The function starts by logging its initiation. If verbosity is enabled (via the `args`
-    # parameter), it also prints an informative message about the start of the fetching process.
+    # The function starts by logging its initiation.
     logger_info.info("Entered fetch_unique_service_count()")
-    if args.verbose:
-        print("Fetching count of unique services from the database...")
 
     try:
         # The SQL query executed here selects and counts all distinct `service_name`
         # entries from the `service_info` table. This helps in determining the
         # number of unique services.
-        cursor.execute("SELECT COUNT(DISTINCT service_name) FROM service_info")
-        unique_service_count = cursor.fetchone()[0]
+        unique_service_count = _fetch_plain_row(cursor, _Q_UNIQUE_SVC)[0]
 
         # Upon successfully fetching the count, the function logs this value.
-        # Additionally, if verbosity is enabled, this count is printed to the console.
         logger_info.info("Count of unique services fetched: %s", unique_service_count)
-        if args.verbose:
-            print("Fetched count of unique services: %s", unique_service_count)
 
         return unique_service_count
     except sqlite3.Error as error:
@@ -150,77 +363,109 @@ def fetch_unique_service_count(cursor: sqlite3.Cursor, args) -> int:
         return 0
 
 # -------------------------------------------------------------------------
-def fetch_all_services(cursor: sqlite3.Cursor, args) -> List[Tuple[Any]]:
+def fetch_all_services(cursor: sqlite3.Cursor, args) -> Iterator[Tuple[Any]]:
     """
     Fetch all service details from the database.
 
+    Only use this when the rows themselves are needed; fetch_service_count() returns the count alone.
+    Rows are streamed from the cursor rather than loaded at once, so the cursor must not be reused
+    until iteration has finished.
+
     Args:
         cursor (sqlite3.Cursor): Database cursor to execute SQL commands.
 
-    Returns:
-        List[Tuple[Any]]: List of service data.
+    Yields:
+        Tuple[Any]: One row of service data.
     """
 
     # At the beginning of the function, a log entry is made to mark its start.
-    # If the verbose mode is on (controlled by the `args` parameter), a message is printed to the console.
     logger_info.info("Entered fetch_all_services()")
-    if args.verbose:
-        print("Fetching all service details from the database...")
 
     try:
         # The SQL query here aims to select all columns from the `service_info` table.
         # This fetches all details of all services.
-        cursor.execute("SELECT * FROM service_info")
-        services = cursor.fetchall()
+        cursor.execute(_Q_ALL_SERVICES)
+        service_count = 0
+        for service_count, service in enumerate(cursor, start=1):
+            yield service
 
-        # After successfully obtaining the list of services, the function logs the number of fetched services.
-        # If verbose mode is enabled, the count is printed to the console as well.
-        logger_info.info("Successfully fetched %s service(s) from the database.", len(services))
-        if args.verbose:
-            print("Fetched %s service(s) from the database.", len(services))
-
-        return services
+        # After all services have been streamed, the function logs the number of fetched services.
+        logger_info.info("Successfully fetched %s service(s) from the database.", service_count)
     except sqlite3.Error as error:
         # In case of any errors while executing the SQL command or related database operations,
         # this block will catch them. Detailed error logs are made for both informational and debugging purposes.
         logger_info.error("Failed to fetch services: %s", error)
         logger_debug.exception("SQLite error while fetching all services")
 
-        # The function returns an empty list if there's a problem in retrieving the services.
-        return []
+        # No further rows are yielded if there's a problem in retrieving the services.
 
 
 # -------------------------------------------------------------------------
-def fetch_all_port_mappings(cursor: sqlite3.Cursor, args) -> List[Tuple[Any]]:
+def fetch_services_with_unique_count(cursor: sqlite3.Cursor, args) -> Tuple[List[Any], int]:
     """
-    Fetch all port mapping details from the database.
+    Fetch all service details together with the count of unique services in one table scan.
+
+    SQLite does not allow COUNT(DISTINCT ...) as a window function, so the distinct service
+    names are collected while the rows are read instead of scanning service_info a second time.
+    When only the count is needed, use fetch_statistics_counts() instead.
 
     Args:
         cursor (sqlite3.Cursor): Database cursor to execute SQL commands.
 
     Returns:
-        List[Tuple[Any]]: List of port mapping data.
+        Tuple[List[Any], int]: List of service data and the count of unique services.
+    """
+
+    logger_info.info("Entered fetch_services_with_unique_count()")
+
+    try:
+        services = cursor.execute(_Q_ALL_SERVICES).fetchall()
+        # Locate service_name by name from the result columns, so this works with or without the
+        # sqlite3.Row factory and does not depend on the column order of service_info.
+        name_index = [column[0] for column in cursor.description].index("service_name")
+        unique_service_count = len({service[name_index] for service in services})
+
+        logger_info.info(
+            "Successfully fetched %s service(s) and %s unique service(s) from the database.",
+            len(services), unique_service_count
+        )
+
+        return services, unique_service_count
+    except sqlite3.Error as error:
+        logger_info.error("Failed to fetch services with unique count: %s", error)
+        logger_debug.exception("SQLite error while fetching services with unique count")
+
+        return [], 0
+
+# -------------------------------------------------------------------------
+def fetch_all_port_mappings(cursor: sqlite3.Cursor, args) -> Iterator[Tuple[Any]]:
+    """
+    Fetch all port mapping details from the database.
+
+    Only use this when the rows themselves are needed; fetch_port_mapping_count() returns the count alone.
+    Rows are streamed from the cursor rather than loaded at once, so the cursor must not be reused
+    until iteration has finished.
+
+    Args:
+        cursor (sqlite3.Cursor): Database cursor to execute SQL commands.
+
+    Yields:
+        Tuple[Any]: One row of port mapping data.
     """
 
     # At the beginning of the function, a log entry is made to indicate the start of the operation.
-    # If verbose mode is activated (through the `args` parameter), a message is also printed to the console.
     logger_info.info("Entered fetch_all_port_mappings()")
-    if args.verbose:
-        print("Fetching all port mapping details from the database...")
 
     try:
         # This SQL command is executed to select all columns from the `port_mappings` table.
         # It aims to gather details of all port mappings.
-        cursor.execute("SELECT * FROM port_mappings")
-        mappings = cursor.fetchall()
+        cursor.execute(_Q_ALL_PORT_MAPPINGS)
+        mapping_count = 0
+        for mapping_count, mapping in enumerate(cursor, start=1):
+            yield mapping
 
-        # After successfully obtaining the list of port mappings, the function logs the number of fetched mappings.
-        # If verbose mode is enabled, this count is also printed to the console.
-        logger_info.info("Successfully fetched %s port mapping record(s) from the database.", len(mappings))
-        if args.verbose:
-            print("Fetched %s port mapping record(s) from the database.", len(mappings))
-
-        return mappings
+        # After all port mappings have been streamed, the function logs the number of fetched mappings.
+        logger_info.info("Successfully fetched %s port mapping record(s) from the database.", mapping_count)
     except sqlite3.Error as error:
         # Should there be any errors during the SQL command execution or related database operations,
         # this block will handle them. It ensures that detailed error logs are created, beneficial for both
@@ -228,39 +473,74 @@ def fetch_all_port_mappings(cursor: sqlite3.Cursor, args) -> List[Tuple[Any]]:
         logger_info.error("Failed to fetch port mappings: %s", error)
         logger_debug.exception("SQLite error while fetching port mappings")
 
-        # If there's an issue retrieving the port mappings, the function returns an empty list.
-        return []
+        # If there's an issue retrieving the port mappings, no further rows are yielded.
 
 # -------------------------------------------------------------------------
-def fetch_all_host_networking(cursor: sqlite3.Cursor, args) -> List[Tuple[Any]]:
+def fetch_port_mappings_columns(cursor: sqlite3.Cursor, args) -> Dict[str, Any]:
     """
-    Fetch all host networking details from the database.
+    Fetch all port mapping details from the database as columns rather than rows.
+
+    The integer columns are packed into array.array('q') buffers instead of one tuple and one int
+    object per row. Callers that need row tuples can rebuild them lazily with zip(*columns.values()).
 
     Args:
         cursor (sqlite3.Cursor): Database cursor to execute SQL commands.
 
     Returns:
-        List[Tuple[Any]]: List of host networking data.
+        Dict[str, Any]: 'id' and 'external_port' as array.array('q'), and 'mapping_values' as a list of str.
+    """
+
+    logger_info.info("Entered fetch_port_mappings_columns()")
+
+    ids = array('q')
+    external_ports = array('q')
+    mapping_values = []
+
+    try:
+        cursor.execute(_Q_PORT_MAPPING_COLUMNS)
+        for mapping_id, external_port, mapping_value in cursor:
+            ids.append(mapping_id)
+            external_ports.append(external_port)
+            mapping_values.append(mapping_value)
+
+        logger_info.info("Successfully fetched %s port mapping record(s) from the database.", len(ids))
+    except sqlite3.Error as error:
+        logger_info.error("Failed to fetch port mapping columns: %s", error)
+        logger_debug.exception("SQLite error while fetching port mapping columns")
+
+        # Return empty columns rather than a partial result.
+        ids, external_ports, mapping_values = array('q'), array('q'), []
+
+    return {'id': ids, 'external_port': external_ports, 'mapping_values': mapping_values}
+
+# -------------------------------------------------------------------------
+def fetch_all_host_networking(cursor: sqlite3.Cursor, args) -> Iterator[Tuple[Any]]:
+    """
+    Fetch all host networking details from the database.
+
+    Only use this when the rows themselves are needed; fetch_host_networking_count() returns the count alone.
+    Rows are streamed from the cursor rather than loaded at once, so the cursor must not be reused
+    until iteration has finished.
+
+    Args:
+        cursor (sqlite3.Cursor): Database cursor to execute SQL commands.
+
+    Yields:
+        Tuple[Any]: One row of host networking data.
     """
 
     # The function starts by logging its entry into the `fetch_all_host_networking` function.
-    # If verbose logging is activated (checked through the `args` parameter), an additional console message is displayed.
     logger_info.info("Entered fetch_all_host_networking()")
-    if args.verbose:
-        print("Fetching all host networking details from the database...")
 
     try:
         # Here, an SQL command is executed to gather all records from the `host_networking` table.
-        cursor.execute("SELECT * FROM host_networking")
-        networking = cursor.fetchall()
+        cursor.execute(_Q_ALL_HOST_NETWORKING)
+        networking_count = 0
+        for networking_count, networking in enumerate(cursor, start=1):
+            yield networking
 
         # The function logs the total number of host networking records retrieved.
-        # If verbose mode is enabled, this count is also displayed on the console.
-        logger_info.info("Successfully fetched %s host networking record(s) from the database.", len(networking))
-        if args.verbose:
-            print("Fetched %s host networking record(s) from the database.", len(networking))
-
-        return networking
+        logger_info.info("Successfully fetched %s host networking record(s) from the database.", networking_count)
     except sqlite3.Error as error:
         # If any errors arise during the SQL command execution or any related database operations,
         # they are gracefully handled within this block. Proper error logs are generated,
@@ -268,8 +548,149 @@ def fetch_all_host_networking(cursor: sqlite3.Cursor, args) -> List[Tuple[Any]]:
         logger_info.error("Failed to fetch host networking details: %s", error)
         logger_debug.exception("SQLite error while fetching host networking details")
 
-        # In the event of any issues in retrieving host networking details, the function returns an empty list.
-        return []
+        # In the event of any issues in retrieving host networking details, no further rows are yielded.
+
+# -------------------------------------------------------------------------
+def fetch_service_count(cursor: sqlite3.Cursor, args) -> int:
+    """
+    Fetch the number of service records in the database without fetching the rows themselves.
+
+    Args:
+        cursor (sqlite3.Cursor): Database cursor to execute SQL commands.
+
+    Returns:
+        int: Count of service records.
+    """
+
+    logger_info.info("Entered fetch_service_count()")
+
+    try:
+        # COUNT(*) is computed inside SQLite, so no row data is materialized in Python.
+        count = _fetch_plain_row(cursor, _Q_COUNT_SERVICES)[0]
+        logger_info.info("Count of service records fetched: %s", count)
+        return count
+    except sqlite3.Error as error:
+        logger_info.error("Failed to fetch service count: %s", error)
+        logger_debug.exception("SQLite error while fetching service count")
+        return 0
+
+# -------------------------------------------------------------------------
+def fetch_port_mapping_count(cursor: sqlite3.Cursor, args) -> int:
+    """
+    Fetch the number of port mapping records in the database without fetching the rows themselves.
+
+    Args:
+        cursor (sqlite3.Cursor): Database cursor to execute SQL commands.
+
+    Returns:
+        int: Count of port mapping records.
+    """
+
+    logger_info.info("Entered fetch_port_mapping_count()")
+
+    try:
+        # COUNT(*) is computed inside SQLite, so no row data is materialized in Python.
+        count = _fetch_plain_row(cursor, _Q_COUNT_PORT_MAPPINGS)[0]
+        logger_info.info("Count of port mapping records fetched: %s", count)
+        return count
+    except sqlite3.Error as error:
+        logger_info.error("Failed to fetch port mapping count: %s", error)
+        logger_debug.exception("SQLite error while fetching port mapping count")
+        return 0
+
+# -------------------------------------------------------------------------
+def fetch_host_networking_count(cursor: sqlite3.Cursor, args) -> int:
+    """
+    Fetch the number of host networking records in the database without fetching the rows themselves.
+
+    Args:
+        cursor (sqlite3.Cursor): Database cursor to execute SQL commands.
+
+    Returns:
+        int: Count of host networking records.
+    """
+
+    logger_info.info("Entered fetch_host_networking_count()")
+
+    try:
+        # COUNT(*) is computed inside SQLite, so no row data is materialized in Python.
+        count = _fetch_plain_row(cursor, _Q_COUNT_HOST_NETWORKING)[0]
+        logger_info.info("Count of host networking records fetched: %s", count)
+        return count
+    except sqlite3.Error as error:
+        logger_info.error("Failed to fetch host networking count: %s", error)
+        logger_debug.exception("SQLite error while fetching host networking count")
+        return 0
+
+# -------------------------------------------------------------------------
+def fetch_statistics_counts(cursor: sqlite3.Cursor, args) -> Tuple[int, int, int]:
+    """
+    Fetch the unique service, port mapping, and host networking counts in a single query.
+
+    The counts are read from the stats_summary view when configure_connection_for_stats() has
+    created it, and from the equivalent aggregate query otherwise.
+
+    Args:
+        cursor (sqlite3.Cursor): Database cursor to execute SQL commands.
+
+    Returns:
+        Tuple[int, int, int]: Count of unique services, port mappings, and host networking records.
+    """
+
+    logger_info.info("Entered fetch_statistics_counts()")
+
+    try:
+        # All three counts come back as one row, so SQLite is entered only once for the statistics.
+        try:
+            row = _fetch_plain_row(cursor, _Q_STATS_SUMMARY)
+        except sqlite3.OperationalError:
+            # The view does not exist on this connection.
+            row = _fetch_plain_row(cursor, _Q_STATS_COUNTS)
+        unique_service_count, port_mapping_count, host_networking_count = row
+
+        logger_info.info(
+            "Fetched counts: %s unique service(s), %s port mapping(s), %s host networking record(s).",
+            unique_service_count, port_mapping_count, host_networking_count
+        )
+
+        return unique_service_count, port_mapping_count, host_networking_count
+    except sqlite3.Error as error:
+        # Any database error is logged and every count falls back to 0.
+        logger_info.error("Failed to fetch statistics counts: %s", error)
+        logger_debug.exception("SQLite error while fetching statistics counts")
+
+        return 0, 0, 0
+
+# Keys produced by generate_statistics(), in order, and the matching pre-encoded output template.
+# Numeric values use %a, which renders ints and floats exactly like str(); the formatted timestamp
+# is passed in as bytes.
+_STATS_TEMPLATE_KEYS = (
+    'total_docker_compose_lines', 'total_unique_services', 'total_port_mappings', 'total_host_networking',
+    'cpu_percent', 'total_memory', 'used_memory', 'available_memory', 'memory_percent', 'perf_timestamp',
+)
+_STATS_TEMPLATE = (
+    b"total_docker_compose_lines: %a\n"
+    b"total_unique_services: %a\n"
+    b"total_port_mappings: %a\n"
+    b"total_host_networking: %a\n"
+    b"cpu_percent: %a\n"
+    b"total_memory: %a\n"
+    b"used_memory: %a\n"
+    b"available_memory: %a\n"
+    b"memory_percent: %a\n"
+    b"perf_timestamp: %s\n"
+)
+
+# -------------------------------------------------------------------------
+def _ensure_output_dir() -> None:
+    """
+    Create the directory containing OUTPUT_FILE, once per process.
+    """
+    global _output_dir_ready  # pylint: disable=global-statement
+
+    if not _output_dir_ready:
+        os.makedirs(_OUTPUT_DIR, exist_ok=True)
+        _output_dir_ready = True
 
 # -------------------------------------------------------------------------
 def write_statistics_to_file(stats: Dict[str, int], args) -> None:
@@ -285,27 +706,41 @@ def write_statistics_to_file(stats: Dict[str, int], args) -> None:
     """
 
     # The function starts by logging its entry into the `write_statistics_to_file` function.
-    # If verbose logging is activated (checked through the `args` parameter), an additional console message is displayed.
     logger_info.info("Entered write_statistics_to_file()")
-    if args.verbose:
-        print("Writing statistics to the output file...")
 
     # The function ensures that the directory containing the OUTPUT_FILE exists.
     # If it doesn't, it creates the necessary directories.
-    os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
+    _ensure_output_dir()
+
+    # The whole file is built as one payload so it can be written with a single call. The
+    # performance timestamp is kept as an integer epoch until it is written out.
+    output_stats = dict(stats)
+    if 'perf_timestamp' in output_stats:
+        output_stats['perf_timestamp'] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(output_stats['perf_timestamp']))
+
+    if tuple(output_stats) == _STATS_TEMPLATE_KEYS:
+        # The usual set of statistics is filled straight into the pre-encoded template.
+        values = list(output_stats.values())
+        values[-1] = values[-1].encode('ascii')
+        payload = _STATS_TEMPLATE % tuple(values)
+    else:
+        # Any other set of keys, e.g. when the system info could not be read, is formatted generically.
+        payload = "".join(f"{key}: {value}\n" for key, value in output_stats.items()).encode('utf-8')
+
+    # The statistics are written to a temporary file next to OUTPUT_FILE and then renamed over it.
+    # os.replace() is atomic, so readers never see a half-written statistics file.
+    temp_file = f"{OUTPUT_FILE}.{os.getpid()}.tmp"
 
     try:
-        # The function attempts to open the OUTPUT_FILE for writing.
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as file:
-            # For each statistic in the `stats` dictionary, the function writes the key-value pair to the file.
-            for key, value in stats.items():
-                file.write(f"{key}: {value}\n")
+        # The function attempts to open the temporary file for writing.
+        with open(temp_file, 'wb') as file:
+            file.write(payload)
+
+        # Publish the completed file in a single step.
+        os.replace(temp_file, OUTPUT_FILE)
 
         # Once the writing process is complete, the function logs the successful write action.
-        # If verbose mode is enabled, this information is also displayed on the console.
         logger_info.info("Statistics written to %s", OUTPUT_FILE)
-        if args.verbose:
-            print("Statistics written to %s", OUTPUT_FILE)
 
     except IOError as error:
         # If there's any error during the file writing process (like permissions issues, disk space problems, etc.),
@@ -313,6 +748,12 @@ def write_statistics_to_file(stats: Dict[str, int], args) -> None:
         logger_info.error("Error writing statistics to file: %s", error)
         logger_debug.exception("Error encountered while writing statistics to file")
 
+        # Remove the partially written temporary file, if one was created.
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
 # -------------------------------------------------------------------------
 def execute_statistics_generation(cursor: sqlite3.Cursor, args) -> None:
     """
@@ -327,10 +768,7 @@ def execute_statistics_generation(cursor: sqlite3.Cursor, args) -> None:
     """
 
     # The function starts by logging its entry into the `execute_statistics_generation` function.
-    # If verbose logging is activated (checked through the `args` parameter), an additional console message is displayed.
     logger_info.info("Entered execute_statistics_generation()")
-    if args.verbose:
-        print("Starting statistics generation...")
 
     # The `generate_statistics` function is invoked using the given cursor and arguments.
     # This function would likely fetch data from the database and calculate various statistics based on that data.
@@ -341,10 +779,10 @@ def execute_statistics_generation(cursor: sqlite3.Cursor, args) -> None:
     write_statistics_to_file(stats, args)
 
     # After the statistics have been successfully written to the file, the function logs the completion of this process.
-    # If verbose mode is enabled, this information is also displayed on the console.
     logger_info.info("Statistics generation completed.")
-    if args.verbose:
-        print("Statistics generation completed.")
+
+    # Emit the verbose console output collected during this run in a single write.
+    _verbose_handler.flush()
 
 # -------------------------------------------------------------------------
 def get_system_info(args) -> dict:
@@ -352,8 +790,9 @@ def get_system_info(args) -> dict:
     Fetch the current CPU and memory utilization of the system.
 
     Retrieves the CPU and memory utilization and returns the data
-    as a dictionary, which contains utilization percentages and
-    total, used, and available memory values.
+    as a dictionary, which contains utilization percentages,
+    total, used, and available memory values, and the time of the
+    sample as an integer epoch (`perf_timestamp`).
 
     Args:
         args (object): An argument object with a 'verbose' attribute for controlling verbosity.
@@ -362,10 +801,7 @@ def get_system_info(args) -> dict:
         dict: Contains CPU and memory utilization data.
     """
 
-    entry_msg = "Entering get_system_info() function..."
-    logger_info.info(entry_msg)
-    if args.verbose:
-        print(entry_msg)
+    logger_info.info("Entering get_system_info() function...")
 
     try:
         cpu_percent = psutil.cpu_percent(interval=None)
@@ -376,29 +812,19 @@ def get_system_info(args) -> dict:
             "used_memory": memory_info.used,
             "available_memory": memory_info.available,
             "memory_percent": memory_info.percent,
-            "perf_timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "perf_timestamp": int(time.time())
         }
 
         logger_debug.debug("System Info: %s", system_info)
 
-        exit_msg = "Exiting get_system_info() function with data retrieved successfully..."
-        logger_info.info(exit_msg)
-        if args.verbose:
-            print(f"System Information: {system_info}")
-            print(exit_msg)
+        logger_info.info("System Information: %s", system_info)
+        logger_info.info("Exiting get_system_info() function with data retrieved successfully...")
 
         return system_info
 
     except psutil.Error as psutil_error:
-        error_msg = f"Error fetching system info from psutil: {psutil_error}"
-        logger_info.error(error_msg)
-        if args.verbose:
-            print(error_msg)
-
-        exit_err_msg = "Exiting get_system_info() function due to a psutil error..."
-        logger_info.error(exit_err_msg)
-        if args.verbose:
-            print(exit_err_msg)
+        logger_info.error("Error fetching system info from psutil: %s", psutil_error)
+        logger_info.error("Exiting get_system_info() function due to a psutil error...")
 
         return {}
 
@@ -416,24 +842,15 @@ def generate_statistics(cursor: sqlite3.Cursor, args) -> Dict[str, int]:
     """
 
     # The function initiates by logging its entry into the `generate_statistics` function.
-    # If verbose logging is activated (checked through the `args` parameter), a console message is displayed.
     logger_info.info("Entered generate_statistics()")
-    if args.verbose:
-        print("Generating statistics based on the database data...")
 
     # The function proceeds to compute and fetch various pieces of data:
 
     # This line computes the total number of lines across all docker-compose.yml files.
     total_docker_compose_lines = compute_lines_in_docker_compose(args)
 
-    # This fetches the number of unique services from the database.
-    unique_service_count = fetch_unique_service_count(cursor, args)
-
-    # This fetches all port mapping details from the database.
-    port_mappings = fetch_all_port_mappings(cursor, args)
-
-    # This fetches all host networking details from the database.
-    host_networking = fetch_all_host_networking(cursor, args)
+    # This fetches the unique service, port mapping, and host networking counts from the database in one query.
+    unique_service_count, port_mapping_count, host_networking_count = fetch_statistics_counts(cursor, args)
 
     # This fetches system and cpu info.
     perf_data = get_system_info(args)
@@ -443,19 +860,16 @@ def generate_statistics(cursor: sqlite3.Cursor, args) -> Dict[str, int]:
     stats = {
         'total_docker_compose_lines': total_docker_compose_lines,
         'total_unique_services': unique_service_count,
-        'total_port_mappings': len(port_mappings),
-        'total_host_networking': len(host_networking)
+        'total_port_mappings': port_mapping_count,
+        'total_host_networking': host_networking_count
     }
 
     # Add the performance data from get_system_info to the stats dictionary
     stats.update(perf_data)
 
     # Once the statistics dictionary is formed, its content is logged for reference.
-    # If verbose logging is active, each statistic is also printed out to the console.
     logger_debug.info("Generated statistics: %s", stats)
-    if args.verbose:
-        for key, value in stats.items():
-            print(f"{key}: {value}")
+    logger_info.info("Generated statistics: %s", stats)
 
     # The function concludes by returning the statistics dictionary.
     return stats
@@ -10,6 +10,14 @@ It includes functions for caching data, checking cache validity, fetching softwa
 import sys
 import os
 import platform
+import shutil
+import re
+import functools
+import bisect
+import subprocess
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import AnyStr, Tuple, Union
 
 # Add config to the sys path
 # pylint: disable=wrong-import-position
@@ -31,25 +39,187 @@ terminal_color_reset = dcpd_config.TERMINAL_COLOR_RESET
 logger_info = dcpd_log_info.logger
 logger_debug = dcpd_log_debug.logger
 
+# Pre-bound INFO logging call for the entry/exit messages that remain on the pagination path
+_info = logger_info.info
+
 # Set length of log file separator
 log_separator_length = dcpd_config.LOG_SEPARATOR_LENGTH
 
 # Initialize the last viewed page to 1
 last_viewed_page = 1
 
+# Separator lines for the log files, built once at import
+_SEP_EQ = "=" * log_separator_length
+_SEP_DASH = "-" * log_separator_length
+
+# ANSI color codes used by the pagination menu
+_RESET = "\033[0m"
+_HEADER = "\033[1m\033[96m"  # Bold Cyan
+_INFO = "\033[93m"  # Yellow
+_COMMAND = "\033[91m"  # Red
+_TEXT = "\033[92m"  # Green
+
+# Pagination options shown below every page
+_PAG_OPTIONS = [
+    ("n", "next"),
+    ("p", "prev"),
+    ("+", "scroll down"),
+    ("-", "scroll up"),
+    ("t", "top"),
+    ("b", "bottom"),
+    ("j", "jump to page"),
+    ("r", "return to prev page"),
+    ("s", "search"),
+    ("l", "set lines/page"),
+    ("q", "quit")
+]
+
+# Set number of options per line for pagination help
+_PAG_OPTIONS_PER_LINE = 4
+
+# Pagination menu text, rendered once so each page redraw is a single write
+_PAG_MENU_HEADER = f"\n{_HEADER}--- Pagination Options ---{_RESET}\n"
+_PAG_MENU = "".join(
+    " | ".join(f"{_COMMAND}{option}{_RESET}: {_TEXT}{description}{_RESET}"
+               for option, description in _PAG_OPTIONS[i:i + _PAG_OPTIONS_PER_LINE]) + "\n"
+    for i in range(0, len(_PAG_OPTIONS), _PAG_OPTIONS_PER_LINE)
+)
+_PAG_SEARCH_MENU = "[: first occurrence | ]: last occurrence | >: next occurrence | <: prev occurrence\n"
+
+# Table header repeated at the top of every page after the first
+_PAGE_HEADER = (
+    "+-----------------------+-----------------+-----------------+----------------+---------------+\n"
+    "|     Service Name      |  External Port  |  Internal Port  |  Port Mapping  |  Mapped App   |\n"
+    "+=======================+=================+=================+================+===============+"
+)
+
+# Byte versions of the page header and highlight codes for paging pure ASCII output
+_PAGE_HEADER_BYTES = _PAGE_HEADER.encode('ascii')
+_HIGHLIGHT_COLOR_BYTES = pagination_highlight_color.encode('utf-8')
+_COLOR_RESET_BYTES = terminal_color_reset.encode('utf-8')
+
 # Check what OS we are running on
 IS_WINDOWS = platform.system() == "Windows"
 IS_UNIX = not IS_WINDOWS  # Assuming all non-Windows systems are considered Unix-like
 # print(f"Is UNIX:  {IS_UNIX}")
 # print(f"Is Windows:  {IS_WINDOWS}")
 
+# Whether ownership can be changed at all; os.chown does not exist on Windows
+_HAS_CHOWN = hasattr(os, "chown")
+
+# Whether chmod/chown can be applied relative to an open directory descriptor
+_DIR_FD_SUPPORTED = _HAS_CHOWN and os.chmod in os.supports_dir_fd and os.chown in os.supports_dir_fd
+
+# Thread pool sizing for the Python permission walk; the work is I/O bound
+_PERMISSION_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Whether stdin is an interactive terminal; this does not change while the program runs
+_IS_INTERACTIVE = bool(getattr(sys.stdin, "isatty", lambda: False)())
+
 # Conditionally import termios only on Unix-like systems
 if IS_UNIX:
     import termios
+    import tty
 
 # Check if the system is Windows and import msvcrt for key input handling
 if IS_WINDOWS:
     import msvcrt
+    # An empty system call enables ANSI escape processing in the Windows console
+    os.system('')
+
+# Set while paginate_output() holds the terminal in single-keypress mode, with the settings to restore
+_raw_active = False
+_saved_terminal_settings = None
+
+# ANSI sequence to move the cursor home and clear the screen
+_CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+# -------------------------------------------------------------------------
+def _apply_permissions(path):
+    """
+    Set 0755 permissions and 1000:1000 ownership on a single path.
+
+    Ownership is skipped on platforms without os.chown, such as Windows.
+
+    Args:
+        path (str): Path of the file or directory to change.
+    """
+    os.chmod(path, 0o755)
+    if _HAS_CHOWN:
+        os.chown(path, 1000, 1000)
+
+# -------------------------------------------------------------------------
+def _apply_directory_permissions(directory):
+    """
+    Set 0755 permissions and 1000:1000 ownership on every entry directly inside a directory.
+
+    Entries come from os.scandir(), so their paths and types need no extra stat calls. Where the
+    platform supports dir_fd, the directory is opened once and its entries are changed relative to
+    that descriptor, so the kernel does not resolve the full path for every entry.
+
+    Args:
+        directory (str): Absolute path of the directory whose entries are changed.
+
+    Returns:
+        List[str]: Paths of the subdirectories found, still to be processed.
+    """
+    subdirectories = []
+
+    if not _DIR_FD_SUPPORTED:
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                _apply_permissions(entry.path)
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+        return subdirectories
+
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                try:
+                    os.chmod(entry.name, 0o755, dir_fd=dir_fd)
+                    os.chown(entry.name, 1000, 1000, dir_fd=dir_fd)
+                except OSError as err:
+                    # Report the full path rather than the name relative to dir_fd
+                    raise OSError(err.errno, err.strerror, entry.path) from err
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+    finally:
+        os.close(dir_fd)
+
+    return subdirectories
+
+# -------------------------------------------------------------------------
+def _set_tree_permissions(top):
+    """
+    Set 0755 permissions and 1000:1000 ownership on a directory tree.
+
+    Each directory is processed by _apply_directory_permissions() on a thread pool, since the work
+    is almost entirely waiting on the kernel; the subdirectories it finds are submitted as new tasks,
+    so no recursion is needed for deep trees. Every entry is changed exactly once, from the scan of
+    its parent directory. The root is never part of a scan, so it is changed up front, matching what
+    chown -R/chmod -R do on Unix.
+
+    Args:
+        top (str): Absolute path of the directory tree.
+    """
+    _apply_permissions(top)
+
+    with ThreadPoolExecutor(max_workers=_PERMISSION_WORKERS) as executor:
+        pending = {executor.submit(_apply_directory_permissions, top)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # result() raises any OSError from the worker to the caller
+                    for subdirectory in future.result():
+                        pending.add(executor.submit(_apply_directory_permissions, subdirectory))
+        except OSError:
+            # Do not start directories that are still queued once one has failed
+            for future in pending:
+                future.cancel()
+            raise
 
 # -------------------------------------------------------------------------
 def set_permissions_and_ownership(args):
@@ -64,7 +234,7 @@ def set_permissions_and_ownership(args):
     """
 
     # Entry messages
-    logger_info.info("Starting the permission and ownership modification process.")
+    _info("Starting the permission and ownership modification process.")
     if args.verbose:
         print("Starting the permission and ownership modification process.")
 
@@ -77,20 +247,20 @@ def set_permissions_and_ownership(args):
     log_separator_debug(logger_debug)
 
     # Logging the OS context can be beneficial for debugging platform-specific issues.
-    logger_info.info("Running on: %s", platform.platform())
+    _info("Running on: %s", platform.platform())
 
 
     try:
-        for root, dirs, files in os.walk(parent_dir):
-            for dir_name in dirs:
-                dir_path = os.path.join(root, dir_name)
-                os.chmod(dir_path, 0o755)
-                os.chown(dir_path, 1000, 1000)
-
-            for file_name in files:
-                file_path = os.path.join(root, file_name)
-                os.chmod(file_path, 0o755)
-                os.chown(file_path, 1000, 1000)
+        if IS_UNIX and shutil.which("chown") and shutil.which("chmod"):
+            # Let chown/chmod walk the tree in C rather than issuing two calls per entry from Python.
+            for command in (["chown", "-R", "1000:1000", parent_dir], ["chmod", "-R", "0755", parent_dir]):
+                result = subprocess.run(command, check=False, capture_output=True, text=True)
+                if result.returncode != 0:
+                    logger_info.error("'%s' exited with code %d: %s", " ".join(command), result.returncode, result.stderr.strip())
+                    if args.verbose:
+                        print(f"'{' '.join(command)}' failed: {result.stderr.strip()}")
+        else:
+            _set_tree_permissions(parent_dir)
 
     except OSError as os_error:
         # Catch specific OS-related errors
@@ -99,7 +269,7 @@ def set_permissions_and_ownership(args):
             print(f"OS-related error encountered: {str(os_error)}")
 
     # Exit messages
-    logger_info.info("Permission and ownership modification finished.")
+    _info("Permission and ownership modification finished.")
     logger_debug.debug("Permission and ownership modification finished.")
 
     if args.verbose:
@@ -113,111 +283,133 @@ def get_keypress() -> str:
     Returns:
         str: Detected keypress in lowercase or 'ARROW_UP' if the up arrow key is pressed.
     """
-    logger_info.info("Determining single keypress.")
-
     if IS_WINDOWS:
         keypress = msvcrt.getch().decode('utf-8')  # Use msvcrt for Windows
+    elif _raw_active:
+        # The pager already holds the terminal in single-keypress mode
+        return _read_keypress()
     else:
         file_descriptor = sys.stdin.fileno()
         old_settings = termios.tcgetattr(file_descriptor)
         try:
-            if IS_UNIX:  # Only set raw mode on Unix-like systems
-                import tty
-                tty.setraw(sys.stdin.fileno())
-            keypress = sys.stdin.read(1)
-            if keypress == '\x1b':  # escape character, might be an arrow key
-                next_char = sys.stdin.read(1)  # read the next character
-                if next_char == '[':  # checking for arrow key sequence
-                    arrow_char = sys.stdin.read(1)
-                    if arrow_char == 'A':
-                        logger_info.info("Single keypress determined.")
-                        return 'ARROW_UP'
+            tty.setraw(file_descriptor)
+            return _read_keypress()
         finally:
-            if IS_UNIX:  # Only restore terminal settings on Unix-like systems
-                termios.tcsetattr(file_descriptor, termios.TCSADRAIN, old_settings)
+            termios.tcsetattr(file_descriptor, termios.TCSADRAIN, old_settings)
 
-    logger_info.info("Single keypress determined.")
     return keypress.lower()
 
 # -------------------------------------------------------------------------
-def is_interactive_terminal():
+def _read_keypress() -> str:
     """
-    Checks if the script is running in an interactive terminal.
+    Read a single keypress from a UNIX terminal that is already in raw or cbreak mode.
 
     Returns:
-        bool: True if the script is running in an interactive terminal, False otherwise.
+        str: Detected keypress in lowercase or 'ARROW_UP' if the up arrow key is pressed.
+    """
+    keypress = sys.stdin.read(1)
+    if keypress == '\x1b':  # escape character, might be an arrow key
+        next_char = sys.stdin.read(1)  # read the next character
+        if next_char == '[':  # checking for arrow key sequence
+            arrow_char = sys.stdin.read(1)
+            if arrow_char == 'A':
+                return 'ARROW_UP'
+    return keypress.lower()
+
+# -------------------------------------------------------------------------
+@contextmanager
+def _raw_mode():
+    """
+    Hold the terminal in single-keypress mode for the duration of the block.
+
+    Entering the mode once for the whole pager avoids three terminal ioctls per keypress in
+    get_keypress(). cbreak mode is used rather than raw mode so that page output keeps its normal
+    newline handling while the mode is held. Does nothing on Windows.
     """
-    logger_info.info("Checking to see if the terminal is interactive.")
+    global _raw_active, _saved_terminal_settings
+
+    if not IS_UNIX:
+        yield
+        return
+
+    file_descriptor = sys.stdin.fileno()
+    _saved_terminal_settings = termios.tcgetattr(file_descriptor)
+    tty.setcbreak(file_descriptor)
+    _raw_active = True
     try:
-        # Check if sys.stdin has the attribute isatty to determine if it's an interactive terminal
-        logger_info.info("Terminal is interactive.")
-        return sys.stdin.isatty()
-    except AttributeError:
-        # If the attribute is not present, it's not an interactive terminal
-        logger_info.info("Terminal is not interactive.")
-        return False
+        yield
+    finally:
+        termios.tcsetattr(file_descriptor, termios.TCSADRAIN, _saved_terminal_settings)
+        _raw_active = False
 
 # -------------------------------------------------------------------------
-def reset_highlights(lines, term):
+def _prompt(prompt: str) -> str:
     """
-    Removes highlights from the specified term in all lines.
+    Read a line of input, temporarily restoring the normal terminal mode if the pager holds it.
 
     Args:
-        lines (List[str]): The list of lines to process.
-        term (str): The term for which highlights need to be removed.
+        prompt (str): The prompt to display.
 
     Returns:
-        List[str]: The list of lines with highlights removed.
+        str: The line entered by the user.
     """
-    logger_info.info("Beginning removal of highlighting from the terminal.")
-
-    # Assuming your highlight format is consistent
-    normal = term
+    if not _raw_active:
+        return input(prompt)
 
-    # Remove the highlights for the specified term in each line
-    processed_lines = [line.replace(highlight_term(term, term), normal) for line in lines]
+    file_descriptor = sys.stdin.fileno()
+    keypress_settings = termios.tcgetattr(file_descriptor)
+    termios.tcsetattr(file_descriptor, termios.TCSADRAIN, _saved_terminal_settings)
+    try:
+        return input(prompt)
+    finally:
+        termios.tcsetattr(file_descriptor, termios.TCSADRAIN, keypress_settings)
 
-    logger_info.info("Finished removing highlighting from the terminal.")
-    return processed_lines
+# -------------------------------------------------------------------------
+def is_interactive_terminal():
+    """
+    Checks if the script is running in an interactive terminal.
 
+    Returns:
+        bool: True if the script is running in an interactive terminal, False otherwise.
+    """
+    # Determined once when the module is imported
+    return _IS_INTERACTIVE
 
 # -------------------------------------------------------------------------
-def highlight_term(line: str, term: str) -> str:
+@functools.lru_cache(maxsize=8)
+def _compile_search_term(term: Union[str, bytes]) -> re.Pattern:
     """
-    Highlights the specified term in the given line.
+    Compile a case-insensitive pattern that matches the search term literally.
 
     Args:
-        line (str): The line of text to highlight.
-        term (str): The term to be highlighted.
+        term (Union[str, bytes]): The term to search for; bytes terms produce a bytes pattern.
 
     Returns:
-        str: The line with the term highlighted.
+        re.Pattern: The compiled pattern, cached per term.
     """
-    logger_info.info("Beginning to highlight lines in the terminal.")
+    return re.compile(re.escape(term), re.IGNORECASE)
 
-    if not term:  # Check for None or empty terms
-        return line
-
-    # Find the index of the term (case-insensitive) in the line
-    term_index = line.lower().find(term.lower())
+# -------------------------------------------------------------------------
+@functools.lru_cache(maxsize=4096)
+def _highlight_cached(line: AnyStr, term: AnyStr, color: AnyStr, reset: AnyStr) -> Tuple[AnyStr, int]:
+    """
+    Highlight every occurrence of the term in a line, memoized per line and term.
 
-    if term_index == -1:
-        logger_info.info("Finished highlighting lines in the terminal.")
-        return line
+    Port tables repeat the same service and host names on many rows, so identical lines are only
+    scanned once per search. The cache is cleared whenever a new search term is entered.
 
-    # Calculate the start and end positions of the term in the line
-    start = term_index
-    end = term_index + len(term)
+    All arguments are either str or bytes.
 
-    # Construct the highlighted version of the line
-    highlighted = (
-        line[:start]
-        + f"{pagination_highlight_color}{line[start:end]}{terminal_color_reset}"
-        + line[end:]
-    )
+    Args:
+        line (AnyStr): The line of text to highlight.
+        term (AnyStr): The term to be highlighted.
+        color (AnyStr): ANSI code placed before each match.
+        reset (AnyStr): ANSI code placed after each match.
 
-    logger_info.info("Finished highlighting the terminal.")
-    return highlighted
+    Returns:
+        Tuple[AnyStr, int]: The highlighted line and the number of matches found.
+    """
+    return _compile_search_term(term).subn(lambda match: color + match.group(0) + reset, line)
 
 # -------------------------------------------------------------------------
 def paginate_output(text: str):
@@ -228,29 +420,88 @@ def paginate_output(text: str):
         text (str): The text to be paginated and displayed.
     """
 
-    logger_info.info("Beginning to paginate the output.")
+    _info("Beginning to paginate the output.")
 
     global lines_per_page, last_viewed_page
 
     # Check if pagination is disabled
     if lines_per_page == 0:
         print(text)
-        logger_info.info("dcpd_utils.paginate_output completed.  Pagination is diabled.")
+        _info("dcpd_utils.paginate_output completed.  Pagination is diabled.")
         return
 
-    original_lines = text.split('\n')
-    lines = original_lines.copy()
-    total_lines = len(lines)
+    # Nothing to page through when not attached to an interactive terminal (e.g. piped output)
+    if not _IS_INTERACTIVE or not sys.stdout.isatty():
+        print(text)
+        _info("dcpd_utils.paginate_output completed.  Output is not an interactive terminal.")
+        return
 
-    total_lines = len(lines)
-    total_pages = (total_lines + lines_per_page - 1) // lines_per_page
-    current_page = last_viewed_page  # Use the last viewed page as the starting page
-    start_line = (current_page - 1) * lines_per_page
+    # Work on local copies of the pagination settings; they are written back on exit
+    _lpp = lines_per_page
+    _lvp = last_viewed_page
+
+    # Pure ASCII output (the usual port tables) is paged as bytes: indexing, searching and
+    # highlighting work on one byte per character and pages go straight to the binary stdout buffer
+    use_bytes = text.isascii() and hasattr(sys.stdout, 'buffer')
+    if use_bytes:
+        data = text.encode('ascii')
+        newline, page_header = b'\n', _PAGE_HEADER_BYTES
+        highlight_color, color_reset = _HIGHLIGHT_COLOR_BYTES, _COLOR_RESET_BYTES
+    else:
+        data = text
+        newline, page_header = '\n', _PAGE_HEADER
+        highlight_color, color_reset = pagination_highlight_color, terminal_color_reset
+
+    # Index the line boundaries instead of splitting the text; line i spans
+    # data[line_offsets[i] + 1:line_offsets[i + 1]]
+    line_offsets = [-1]
+    line_offsets.extend(match.start() for match in re.finditer(newline, data))
+    line_offsets.append(len(data))
+    total_lines = len(line_offsets) - 1
+    total_pages = (total_lines + _lpp - 1) // _lpp
+    current_page = _lvp  # Use the last viewed page as the starting page
+    start_line = (current_page - 1) * _lpp
 
     in_search_mode = False
     search_term = None
     search_positions = []
+    search_starts = []  # Page-aligned start line for each entry in search_positions
     search_index = 0  # Index in search_positions
+    highlighted_term = None  # Term highlighted on every page after a successful search
+    # -------------------------------------------------------------------------
+    def page_text(start: int, end: int) -> AnyStr:
+        """
+        Returns the lines from start up to end, highlighting the last successfully searched term.
+
+        Args:
+            start (int): The index of the first line.
+            end (int): The index after the last line.
+
+        Returns:
+            AnyStr: The requested lines joined by newlines, as bytes when paging ASCII output.
+        """
+        chunk = data[line_offsets[start] + 1:line_offsets[end]]
+        if highlighted_term is None:
+            return chunk
+        return newline.join(
+            _highlight_cached(line, highlighted_term, highlight_color, color_reset)[0]
+            for line in chunk.split(newline)
+        )
+    # -------------------------------------------------------------------------
+    def write_output(output: AnyStr):
+        """
+        Writes paged output to stdout in a single call.
+
+        Args:
+            output (AnyStr): The output to write, as bytes when paging ASCII output.
+        """
+        if use_bytes:
+            sys.stdout.flush()  # Keep ordering with anything already written as text
+            sys.stdout.buffer.write(output)
+            sys.stdout.buffer.flush()
+        else:
+            sys.stdout.write(output)
+            sys.stdout.flush()
     # -------------------------------------------------------------------------
     def print_page(start: int, page_number: int):
         """
@@ -263,200 +514,188 @@ def paginate_output(text: str):
         Returns:
             int: The ending index of the lines that were printed.
         """
-        # Log the start of the print_page process
-        logger_info.info("dcpd_utils.print_page started.")
-
         # Clear the terminal screen to show the new page
         clear_terminal()
 
-        # If it's not the first page, print the header
-        if page_number != 1:
-            custom_header = "+-----------------------+-----------------+-----------------+----------------+---------------+"
-            print(custom_header)
-            print("|     Service Name      |  External Port  |  Internal Port  |  Port Mapping  |  Mapped App   |")
-            print("+=======================+=================+=================+================+===============+")
-
         # Calculate the ending line index for the current page
-        end = min(start + lines_per_page, total_lines)
+        end = min(start + _lpp, total_lines)
 
-        # Extract the lines for the current page
-        page_lines = lines[start:end]
+        # Only the lines for the current page are materialized
+        page = page_text(start, end)
 
-        # Print the lines for the current page
-        print('\n'.join(page_lines))
+        # Write the header (if it's not the first page) and the page in a single call
+        if page_number != 1:
+            write_output(page_header + newline + page + newline)
+        else:
+            write_output(page + newline)
 
         # Return the index of the last line displayed on this page
         return end
     # -------------------------------------------------------------------------
 
-    # Print each page until all lines are covered
-    while start_line < total_lines:
-        # Print the current page using the print_page function
-        end_line = print_page(start_line, current_page)
-
-
-        # ANSI color codes
-        RESET = "\033[0m"
-        HEADER = "\033[1m\033[96m"  # Bold Cyan
-        INFO = "\033[93m"  # Yellow
-        COMMAND = "\033[91m"  # Red
-        TEXT = "\033[92m"  # Green
-
-        # Define pagination options
-        options = [
-            ("n", "next"),
-            ("p", "prev"),
-            ("+", "scroll down"),
-            ("-", "scroll up"),
-            ("t", "top"),
-            ("b", "bottom"),
-            ("j", "jump to page"),
-            ("r", "return to prev page"),
-            ("s", "search"),
-            ("l", "set lines/page"),
-            ("q", "quit")
-        ]
-
-        # Print pagination options
-        print(f"\n{HEADER}--- Pagination Options ---{RESET}")
-        print(f"{INFO}Page: {current_page}/{total_pages} | Lines/Page: {lines_per_page} | Previous Page: {last_viewed_page}{RESET}")
-
-        # Set number of options per line for pagination help
-        options_per_line = 4
-
-        # Print each pagination option
-        for i, (option, description) in enumerate(options, start=1):
-            print(f"{COMMAND}{option}{RESET}: {TEXT}{description}{RESET}", end=" | " if i % options_per_line != 0 and i != len(options) else "\n")
-
-        if in_search_mode or search_term:  # display search navigation options if in search mode or if a term was searched previously
-            print("[: first occurrence | ]: last occurrence | >: next occurrence | <: prev occurrence")
-
-        temp_current_page = current_page
-
-        try:
-            print("Enter your choice: ", end='', flush=True)
-            choice = get_keypress()
-
-            if choice == 'j':
-                page_num_str = input("Enter page number and press enter: ")
-                try:
-                    page_num = int(page_num_str)
-                    if 1 <= page_num <= total_pages:
-                        # print(f"'j' option last_viewed_page at entry: {last_viewed_page}")
-                        # print(f"'j' option current_page at entry: {current_page}")
-                        # print(f"'j' option start_line at entry: {start_line}")
-                        start_line = (page_num - 1) * lines_per_page
-                        current_page = page_num
-                        # last_viewed_page = current_page
-                        # print(f"'j' option last_viewed_page at exit: {last_viewed_page}")
-                        # print(f"'j' option current_page at exit: {current_page}")
-                        # print(f"'j' option start_line at exit: {start_line}")
+    # Hold the terminal in single-keypress mode for the whole pager instead of per keypress
+    with _raw_mode():
+        # Print each page until all lines are covered
+        while start_line < total_lines:
+            # Print the current page using the print_page function
+            end_line = print_page(start_line, current_page)
+
+            # Only the status line changes between pages; the rest of the menu is prebuilt at import
+            menu = (
+                f"{_PAG_MENU_HEADER}"
+                f"{_INFO}Page: {current_page}/{total_pages} | Lines/Page: {_lpp} | Previous Page: {_lvp}{_RESET}\n"
+                f"{_PAG_MENU}"
+            )
+            if in_search_mode or search_term:  # display search navigation options if in search mode or if a term was searched previously
+                menu += _PAG_SEARCH_MENU
+            sys.stdout.write(menu)
+            sys.stdout.flush()
+
+            temp_current_page = current_page
+
+            try:
+                print("Enter your choice: ", end='', flush=True)
+                choice = get_keypress()
+
+                if choice == 'j':
+                    page_num_str = _prompt("Enter page number and press enter: ")
+                    try:
+                        page_num = int(page_num_str)
+                        if 1 <= page_num <= total_pages:
+                            # print(f"'j' option _lvp at entry: {_lvp}")
+                            # print(f"'j' option current_page at entry: {current_page}")
+                            # print(f"'j' option start_line at entry: {start_line}")
+                            start_line = (page_num - 1) * _lpp
+                            current_page = page_num
+                            # _lvp = current_page
+                            # print(f"'j' option _lvp at exit: {_lvp}")
+                            # print(f"'j' option current_page at exit: {current_page}")
+                            # print(f"'j' option start_line at exit: {start_line}")
+                        else:
+                            print(f"Page number out of range. Valid pages: 1-{total_pages}")
+                    except ValueError:
+                        print("Invalid page number.")
+                elif choice == 'ARROW_UP':
+                    continue  # Just ignore for now, but can be used for navigation in the future
+                elif choice == 'n' and temp_current_page < total_pages:
+                    _lvp = current_page
+                    current_page += 1
+                    start_line += _lpp
+                elif choice == 'p' and temp_current_page > 1:
+                    _lvp = current_page
+                    current_page -= 1
+                    start_line -= _lpp
+                elif choice == '+':
+                    start_line = max(0, min(start_line + 1, total_lines - _lpp))  # Never scroll above the first line
+                elif choice == '-':
+                    start_line = max(0, start_line - 1)
+                elif choice == 'a':
+                    _info("dcpd_utils.print_page completed.")
+                    write_output(page_text(start_line, total_lines) + newline)
+                    lines_per_page = _lpp
+                    last_viewed_page = _lvp
+                    return
+                elif choice == 't':
+                    _lvp = current_page
+                    current_page = 1
+                    start_line = 0
+                    print("\nJumped to the top page.\n")
+                elif choice == 'b':
+                    _lvp = current_page
+                    current_page = total_pages
+                    start_line = (total_pages - 1) * _lpp
+                    print("\nJumped to the last page.\n")
+                elif choice == 's':
+                    term = _prompt("Enter term to search for: ")
+                    if term:
+                        # Only keep cached highlights for the term currently being searched
+                        if term != search_term:
+                            _highlight_cached.cache_clear()
+                        search_term = term
+                        # A term with non-ASCII characters cannot occur in ASCII output
+                        needle = term
+                        if use_bytes:
+                            needle = term.encode('ascii') if term.isascii() else None
+                        # Scan the whole text once and map each match back to its line
+                        search_positions = []
+                        if needle is not None:
+                            for match in _compile_search_term(needle).finditer(data):
+                                line_index = bisect.bisect_right(line_offsets, match.start()) - 1
+                                if not search_positions or search_positions[-1] != line_index:
+                                    search_positions.append(line_index)
+                        # Pages are highlighted as they are displayed
+                        if search_positions:
+                            highlighted_term = needle
+                        search_starts = [(position // _lpp) * _lpp for position in search_positions]
+                    if search_positions:
+                        start_line = search_starts[search_index]  # Already aligned to the start of the page
+                        current_page = (start_line // _lpp) + 1
+                        print(f"\n\033[91mTerm found on page {current_page}\033[0m\n")
+                        in_search_mode = True
                     else:
-                        print(f"Page number out of range. Valid pages: 1-{total_pages}")
-                except ValueError:
-                    print("Invalid page number.")
-            elif choice == 'ARROW_UP':
-                continue  # Just ignore for now, but can be used for navigation in the future
-            elif choice == 'n' and temp_current_page < total_pages:
-                last_viewed_page = current_page
-                current_page += 1
-                start_line += lines_per_page
-            elif choice == 'p' and temp_current_page > 1:
-                last_viewed_page = current_page
-                current_page -= 1
-                start_line -= lines_per_page
-            elif choice == '+':
-                start_line = min(start_line + 1, total_lines - lines_per_page)
-            elif choice == '-':
-                start_line = max(0, start_line - 1)
-            elif choice == 'a':
-                logger_info.info("dcpd_utils.print_page completed.")
-                print('\n'.join(lines[start_line:]))
-                return
-            elif choice == 't':
-                last_viewed_page = current_page
-                current_page = 1
-                start_line = 0
-                print("\nJumped to the top page.\n")
-            elif choice == 'b':
-                last_viewed_page = current_page
-                current_page = total_pages
-                start_line = (total_pages - 1) * lines_per_page
-                print("\nJumped to the last page.\n")
-            elif choice == 's':
-                term = input("Enter term to search for: ")
-                if term:
-                    search_term = term
-                    search_positions = [i for i, line in enumerate(original_lines) if term.lower() in line.lower()]
-                if search_positions:
-                    search_position = search_positions[search_index]
-                    start_line = (search_position // lines_per_page) * lines_per_page  # This ensures start_line is at the start of the page
-                    current_page = (start_line // lines_per_page) + 1
-                    print(f"\n\033[91mTerm found on page {current_page}\033[0m\n")
-                    lines = [highlight_term(line, term) for line in original_lines]
-                    in_search_mode = True
-                else:
-                    print("\n\033[91mSearch term not found.\033[0m\n")
-                    in_search_mode = False
-            elif choice == '>' and in_search_mode:
-                search_index += 1
-                if search_index < len(search_positions):
-                    search_position = search_positions[search_index]
-                    start_line = (search_position // lines_per_page) * lines_per_page  # This ensures start_line is at the start of the page
-                    current_page = (start_line // lines_per_page) + 1
-                else:
-                    print("\nReached the last occurrence of the search term.\n")
-                    in_search_mode = False  # Exiting search mode
-            elif choice == '<' and in_search_mode:
-                search_index -= 1
-                if search_index >= 0:
-                    search_position = search_positions[search_index]
-                    start_line = (search_position // lines_per_page) * lines_per_page  # This ensures start_line is at the start of the page
-                    current_page = (start_line // lines_per_page) + 1
-                else:
-                    print("\nReached the first occurrence of the search term.\n")
-                    in_search_mode = False  # Exiting search mode
-            elif choice == 'l':
-                new_lpp = input(f"Enter new lines-per-page setting (current {lines_per_page}): ")
-                try:
-                    lines_per_page = int(new_lpp)
-                except ValueError:
-                    print("Invalid lines-per-page setting. Using the previous setting.")
-            elif choice == 'r':
-                current_page = last_viewed_page
-                start_line = (current_page - 1) * lines_per_page
-                print("\nReturned to the previously viewed page.\n")
-                print(f"current_page: {current_page}")
-            elif choice == 'q':
+                        print("\n\033[91mSearch term not found.\033[0m\n")
+                        in_search_mode = False
+                elif choice == '>' and in_search_mode:
+                    search_index += 1
+                    if search_index < len(search_positions):
+                        start_line = search_starts[search_index]  # Already aligned to the start of the page
+                        current_page = (start_line // _lpp) + 1
+                    else:
+                        print("\nReached the last occurrence of the search term.\n")
+                        in_search_mode = False  # Exiting search mode
+                elif choice == '<' and in_search_mode:
+                    search_index -= 1
+                    if search_index >= 0:
+                        start_line = search_starts[search_index]  # Already aligned to the start of the page
+                        current_page = (start_line // _lpp) + 1
+                    else:
+                        print("\nReached the first occurrence of the search term.\n")
+                        in_search_mode = False  # Exiting search mode
+                elif choice == 'l':
+                    new_lpp = _prompt(f"Enter new lines-per-page setting (current {_lpp}): ")
+                    try:
+                        lpp_value = int(new_lpp)
+                    except ValueError:
+                        lpp_value = 0
+                    # Only a positive number of lines per page can be used for paging
+                    if lpp_value > 0:
+                        _lpp = lpp_value
+                        # Occurrence start lines depend on the page size
+                        search_starts = [(position // _lpp) * _lpp for position in search_positions]
+                    else:
+                        print("Invalid lines-per-page setting. Using the previous setting.")
+                elif choice == 'r':
+                    current_page = _lvp
+                    start_line = (current_page - 1) * _lpp
+                    print("\nReturned to the previously viewed page.\n")
+                    print(f"current_page: {current_page}")
+                elif choice == 'q':
+                    break
+                elif choice == '[':
+                    # Jump to the first occurrence
+                    if search_positions:
+                        search_index = 0
+                        start_line = search_starts[search_index]  # Already aligned to the start of the page
+                        current_page = (start_line // _lpp) + 1
+                    else:
+                        print("\n\033[91mSearch term not found.\033[0m\n")
+
+                elif choice == ']':
+                    # Jump to the last occurrence
+                    if search_positions:
+                        search_index = len(search_positions) - 1
+                        start_line = search_starts[search_index]  # Already aligned to the start of the page
+                        current_page = (start_line // _lpp) + 1
+                    else:
+                        print("\n\033[91mSearch term not found.\033[0m\n")
+            except (KeyboardInterrupt, EOFError):
+                # Handle Ctrl+C or Ctrl+D gracefully
+                print("\nPagination interrupted.")
                 break
-            elif choice == '[':
-                # Jump to the first occurrence
-                if search_positions:
-                    search_index = 0
-                    search_position = search_positions[search_index]
-                    start_line = (search_position // lines_per_page) * lines_per_page  # This ensures start_line is at the start of the page
-                    current_page = (start_line // lines_per_page) + 1
-                else:
-                    print("\n\033[91mSearch term not found.\033[0m\n")
-
-            elif choice == ']':
-                # Jump to the last occurrence
-                if search_positions:
-                    search_index = len(search_positions) - 1
-                    search_position = search_positions[search_index]
-                    start_line = (search_position // lines_per_page) * lines_per_page  # This ensures start_line is at the start of the page
-                    current_page = (start_line // lines_per_page) + 1
-                else:
-                    print("\n\033[91mSearch term not found.\033[0m\n")
-        except (KeyboardInterrupt, EOFError):
-            # Handle Ctrl+C or Ctrl+D gracefully
-            print("\nPagination interrupted.")
-            break
-
-    # Resetting search mode at the end
-    if in_search_mode:
-        lines = reset_highlights(lines, search_term)
-    logger_info.info("Finished paginating the output.")
+
+    lines_per_page = _lpp
+    last_viewed_page = _lvp
+    _info("Finished paginating the output.")
 
 # -------------------------------------------------------------------------
 def log_separator_info(logger):
@@ -466,11 +705,8 @@ def log_separator_info(logger):
     Args:
         logger (logging.Logger): Logger object to which the separator should be logged.
     """
-    # Create a separator line of "=" characters with the specified length
-    separator = "=" * log_separator_length
-
-    # Log the separator line at the INFO level
-    logger.info(separator)
+    # Log the prebuilt separator line at the INFO level
+    logger.info(_SEP_EQ)
 
     # Log a debug message indicating that the INFO separator has been logged
     logger_debug.debug("Logged INFO separator.")
@@ -483,11 +719,8 @@ def log_separator_debug(logger):
     Args:
         logger (logging.Logger): Logger object to which the separator should be logged.
     """
-    # Create a separator line of "=" characters with the specified length
-    separator = "=" * log_separator_length
-
-    # Log the separator line at the DEBUG level
-    logger.debug(separator)
+    # Log the prebuilt separator line at the DEBUG level
+    logger.debug(_SEP_EQ)
 
     # Log a debug message indicating that the DEBUG separator has been logged
     logger_debug.debug("Logged DEBUG separator.")
@@ -501,11 +734,8 @@ def log_separator_data(logger):
     Args:
         logger (logging.Logger): Logger object to which the separator should be logged.
     """
-    # Create a separator line of "-" characters with the specified length
-    separator = "-" * log_separator_length
-
-    # Log the separator line at the DEBUG level
-    logger.debug(separator)
+    # Log the prebuilt separator line at the DEBUG level
+    logger.debug(_SEP_DASH)
 
     # Log a debug message indicating that the data separator has been logged
     logger_debug.debug("Logged data separator.")
@@ -513,22 +743,17 @@ def log_separator_data(logger):
 # -------------------------------------------------------------------------
 def clear_terminal():
     """
-    Clears the terminal screen by executing system-specific commands.
+    Clears the terminal screen by writing the ANSI clear-screen sequence.
 
-    This function checks if the script is running on a Windows system or a non-Windows system
-    and then uses the appropriate command to clear the terminal screen.
+    Writing the escape sequence directly avoids spawning a 'clear' or 'cls' process on every page.
+    Nothing is written when stdout is not a terminal.
 
     Note:
-        The behavior of this function might vary based on the operating system.
+        On Windows, ANSI processing is enabled once when this module is imported.
 
     """
-    logger_info.info("dcpd_utils.clear_terminal started.")
+    if sys.stdout.isatty():
+        # Move the cursor home and clear the screen
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
 
-    if IS_WINDOWS:
-        # If running on a Windows system, use 'cls' command to clear the terminal screen
-        os.system('cls')
-        logger_info.info("dcpd_utils.clear_terminal completed.")
-    else:
-        # If running on a non-Windows system, use 'clear' command to clear the terminal screen
-        os.system('clear')
-        logger_info.info("dcpd_utils.clear_terminal completed.")